@@ -36,17 +36,20 @@ def main():
         Column("expires_at", TIMESTAMP, nullable=False)
     )
     metadata.create_all(engine)
-    with engine.connect() as conn:
-        user_exists = conn.execute(
-            select(users.c.username).where(users.c.username == username)
-        ).fetchone()
-
-        if user_exists:
-            print(f"Error: User '{username}' already exists. Please choose a different username.")
-            sys.exit(1)
 
     try:
+        # Check and insert within a single transaction to avoid extra
+        # connection round trips and commits
         with engine.begin() as conn:
+            user_exists = conn.execute(
+                select(users.c.username).where(users.c.username == username)
+            ).fetchone()
+
+            if user_exists:
+                print(f"Error: User '{username}' already exists. "
+                      "Please choose a different username.")
+                sys.exit(1)
+
             user_id = uuid.uuid4()
             conn.execute(users.insert().values(
                 id=user_id,
@@ -56,11 +59,12 @@ def main():
             ))
 
             token_value = uuid.uuid4().hex
+            created_at = datetime.now(UTC)
             conn.execute(tokens.insert().values(
                 token=token_value,
                 username=username,
-                created_at=datetime.now(UTC),
-                expires_at=datetime.now(UTC) + timedelta(days=30)
+                created_at=created_at,
+                expires_at=created_at + timedelta(days=30)
             ))
 
         print(f"\n User '{username}' created with token: {token_value}")
@@ -24,8 +24,14 @@ DEFAULT_ZULL_TENANTS = {
     "components-integration",
 }
 DEFAULT_CHUNK_SIZE = 1024
+DEFAULT_CHUNK_OVERLAP = 100
 DEFAULT_MAX_RESULTS = 10000
+DEFAULT_JIRA_PAGE_SIZE = 500
 DEFAULT_DATE_CUTOFF = "2000-01-01T00:00:00Z"
 DEFAULT_NUM_SCRAPER_PROCESSES=10
+DEFAULT_UPSERT_BATCH_SIZE=64
+DEFAULT_EMBEDDING_CACHE_SIZE=1024
+DEFAULT_EMBEDDING_BATCH_SIZE=64
+DEFAULT_EMBEDDING_CONCURRENCY=4
 DEFAULT_ERRATA_PUBLIC_URL="https://access.redhat.com/errata"
 DEFAULT_SOLUTIONS_PUBLIC_URL="https://access.redhat.com"
@@ -3,8 +3,6 @@ import logging
 from typing import TypedDict, List, Dict
 import json
 
-import pandas as pd
-
 from data_scraper.core.scraper import Scraper
 
 LOG = logging.getLogger(__name__)
@@ -51,32 +49,18 @@ class CILogsScraper(Scraper):
         for field in ["text"]:
             chunks += self.text_processor.split_text(record[field])
 
-        return chunks
+        # Prefix every chunk with the name of the failed test so that chunks
+        # from the middle of a traceback are still tied to their test
+        return [f"{record['test_name']}\n{chunk}" for chunk in chunks]
 
     def record_postprocessing(self, record):
         # Postprocessing is not required
         pass
 
-    # pylint: disable=R0801
     def cleanup_records(
         self, records: list, backup: bool, backup_path: str
     ) -> list:
-        df = pd.DataFrame(records)
-
-        LOG.info("Records stats BEFORE cleanup:")
-        LOG.info(df.info())
-
-        df = df.dropna()
-        df = df.drop_duplicates(subset=["text"])
-
-        LOG.info("Records stats AFTER cleanup:")
-        LOG.info(df.info())
-
-        if backup:
-            LOG.info("Saving backup to: %s", backup_path)
-            df.to_pickle(backup_path)
-
-        return [CILogsRecord(**row) for row in df.to_dict(orient="records")]
+        return self._cleanup_records_with_pandas(records, backup, backup_path)
 
     def _get_job_url(self, url: str) -> str:
         """
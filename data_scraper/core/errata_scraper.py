@@ -1,14 +1,13 @@
 """Code for scraping Errata data"""
 import logging
-import multiprocessing as mp
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import TypedDict
 import regex as re
 
-import pandas as pd
-
 from data_scraper.core.scraper import Scraper
 from data_scraper.processors.errata_provider import ErrataProvider
 
@@ -16,6 +15,9 @@ from data_scraper.processors.errata_provider import ErrataProvider
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.INFO)
 
+# Revision suffix of fulladvisory field (e.g., ABCD-2025:1234-02)
+FULLADVISORY_REVISION_PATTERN = re.compile(r"-\d{2}$")
+
 
 class ErrataRecord(TypedDict):
     """Represents a record extracted from Errata.
@@ -50,7 +52,8 @@ class ErrataScraper(Scraper):
     def __init__(self, config: dict):
         super().__init__(config=config)
         self.config = config
-        self.errata_provider = ErrataProvider(self.config["errata_url"])
+        self.errata_provider = ErrataProvider(
+            self.config["errata_url"], self.config["scraper_processes"])
         self._kerberos_authenticate()
 
     def _kerberos_authenticate(self):
@@ -69,7 +72,7 @@ class ErrataScraper(Scraper):
     def _get_fulladvisory(response: dict) -> str:
         """Get full fulladvisory field from response."""
         key = next(iter(response["errata"]))
-        return re.sub(r"-\d{2}$", "", response["errata"][key]["fulladvisory"])
+        return FULLADVISORY_REVISION_PATTERN.sub("", response["errata"][key]["fulladvisory"])
 
     def get_documents(self) -> list[dict]:
         results = self.errata_provider.search_erratas(self.config["errata_product_ids"])
@@ -81,12 +84,12 @@ class ErrataScraper(Scraper):
         current_page = results[0]["page"]["current_page"]
         total_pages = results[0]["page"]["total_pages"]
 
-        # Get all erratas assigned to specific projects
-        with mp.Pool(self.config["scraper_processes"]) as pool:
-            args = [(self.config["errata_product_ids"],page)
-                    for page in range(current_page + 1, total_pages + 1)]
-
-            results += pool.starmap(self.errata_provider.search_erratas, args)\
+        # Get all erratas assigned to specific projects. Requests are I/O bound,
+        # so use threads sharing the provider's connection pool.
+        with ThreadPoolExecutor(max_workers=self.config["scraper_processes"]) as executor:
+            search_erratas = partial(
+                self.errata_provider.search_erratas, self.config["errata_product_ids"])
+            results += executor.map(search_erratas, range(current_page + 1, total_pages + 1))
 
         # Filter erratas based on created_at date
         project_erratas: list[dict] = []
@@ -98,9 +101,9 @@ class ErrataScraper(Scraper):
 
         LOG.info("Number of erratas to process: %s", len(project_erratas))
         # Get additional info for obtained erratas
-        with mp.Pool(self.config["scraper_processes"]) as pool:
+        with ThreadPoolExecutor(max_workers=self.config["scraper_processes"]) as executor:
             args = [errata["id"] for errata in project_erratas]
-            results = pool.map(self.errata_provider.get_errata, args)
+            results = list(executor.map(self.errata_provider.get_errata, args))
 
         return results
 
@@ -151,19 +154,4 @@ class ErrataScraper(Scraper):
     def cleanup_records(
         self, records: list, backup: bool, backup_path: str
     ) -> list:
-        df = pd.DataFrame(records)
-
-        LOG.info("Records stats BEFORE cleanup:")
-        LOG.info(df.info())
-
-        df = df.dropna()
-        df = df.drop_duplicates(subset=["text"])
-
-        LOG.info("Records stats AFTER cleanup:")
-        LOG.info(df.info())
-
-        if backup:
-            LOG.info("Saving backup to: %s", backup_path)
-            df.to_pickle(backup_path)
-
-        return [ErrataRecord(**row) for row in df.to_dict(orient="records")]
+        return self._cleanup_records_with_pandas(records, backup, backup_path)
@@ -1,16 +1,21 @@
 """Jira Scraper"""
 
 import uuid
+import hashlib
 import logging
-import multiprocessing as mp
-from typing import List, Dict, TypedDict, Any
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, TypedDict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
 
 import pandas as pd
 from tqdm import tqdm
 from openai import OpenAI
 
+from data_scraper.common import constants
 from data_scraper.processors.jira_provider import JiraProvider
 from data_scraper.processors.vector_store import QdrantVectorStoreManager
 from data_scraper.processors.text_processor import TextProcessor
@@ -58,16 +63,42 @@ class JiraRecord(TypedDict, total=False):
     comments: str
 
 
+class EmbeddingCache:
+    """Thread safe cache of embeddings keyed by content hash.
+
+    The oldest entry is evicted once the cache reaches max_size entries.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._embeddings: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float] | None]:
+        """Get cached embeddings for keys, None for keys not in the cache."""
+        with self._lock:
+            return {key: self._embeddings.get(key) for key in keys}
+
+    def update(self, embeddings: dict[str, list[float]]) -> None:
+        """Add embeddings to the cache."""
+        with self._lock:
+            for key, embedding in embeddings.items():
+                if len(self._embeddings) >= self.max_size:
+                    del self._embeddings[next(iter(self._embeddings))]
+                self._embeddings[key] = embedding
+
+
 class Scraper:
     """Base Scraper class."""
 
     def __init__(self, config: Dict):
         self.config = config
         self.db_manager = QdrantVectorStoreManager(
-            config["database_client_url"], config["database_api_key"]
+            config["database_client_url"], config["database_api_key"],
+            prefer_grpc=config["database_prefer_grpc"],
         )
         self.text_processor = TextProcessor(
-            config["embedding_model"], config["chunk_size"]
+            config["embedding_model"], config["chunk_size"], config["chunk_overlap"]
         )
         self.llm_client = OpenAI(
             base_url=config["llm_server_url"],
@@ -76,6 +107,7 @@ class Scraper:
         )
         self.backup = config["backup"]
         self.backup_path = config["backup_path"]
+        self.embedding_cache = EmbeddingCache(constants.DEFAULT_EMBEDDING_CACHE_SIZE)
 
     def get_embedding_dimension(self) -> int:
         """Get embedding dimension for the model."""
@@ -84,6 +116,39 @@ class Scraper:
         )
         return len(response.data[0].embedding)
 
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for texts.
+
+        Texts that are not cached yet are sent to the embedding model in
+        batches of up to DEFAULT_EMBEDDING_BATCH_SIZE inputs per request.
+        Embeddings are cached by content hash so that chunks repeated across
+        records are embedded only once. The method may be called from multiple
+        threads.
+        """
+        keys = [
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+            for text in texts
+        ]
+        embeddings = self.embedding_cache.get_many(keys)
+        missing = {
+            key: text for key, text in zip(keys, texts) if embeddings[key] is None
+        }
+
+        missing_keys = list(missing)
+        batch_size = constants.DEFAULT_EMBEDDING_BATCH_SIZE
+        for start in range(0, len(missing_keys), batch_size):
+            batch_keys = missing_keys[start:start + batch_size]
+            response = self.llm_client.embeddings.create(
+                model=self.config["embedding_model"],
+                input=[missing[key] for key in batch_keys],
+            )
+            for data in response.data:
+                embeddings[batch_keys[data.index]] = data.embedding
+
+        self.embedding_cache.update({key: embeddings[key] for key in missing_keys})
+
+        return [embeddings[key] for key in keys]
+
     def get_chunks(self, record: Any) -> List[str]:
         """Create chunks of text to be passed to embedding model.
         Length must respect model context constraint."""
@@ -111,7 +176,18 @@ class Scraper:
                 self.config["db_collection_name"])
             raise IOError
 
-        for record in tqdm(records, desc="Processing embeddings"):
+        keyed_records = self._key_records(records, record_fields_for_key)
+        self._upsert_records(self._embed_records(keyed_records), len(keyed_records))
+
+    def _key_records(self,
+                     records: list,
+                     record_fields_for_key: tuple[str, ...]) -> list[tuple[str, dict]]:
+        """Pair records with database IDs derived from record_fields_for_key.
+
+        Records missing any of the fields are skipped.
+        """
+        keyed_records = []
+        for record in records:
             missing_fields = [
                 field for field in record_fields_for_key
                 if field not in record or not record[field]
@@ -121,27 +197,84 @@ class Scraper:
                 continue
 
             combined_key = "_".join([record[field] for field in record_fields_for_key])
-            record_id = str(uuid.uuid5(uuid.NAMESPACE_URL, combined_key))
+            keyed_records.append((str(uuid.uuid5(uuid.NAMESPACE_URL, combined_key)), record))
 
-            chunks: list[str] = self.get_chunks(record)
+        return keyed_records
 
-            embeddings: list[list[float]] = []
-            for chunk in chunks:
-                embeddings.append(
-                    self.llm_client.embeddings.create(
-                        model=self.config["embedding_model"], input=chunk
-                    )
-                    .data[0]
-                    .embedding
-                )
-
-            self.record_postprocessing(record)
-            point = self.db_manager.build_record(
-                record_id=record_id,
-                payload=dict(record),
-                vector=embeddings,
-            )
-            self.db_manager.upsert_data(self.config["db_collection_name"], [point])
+    def _embed_records(
+        self, keyed_records: list[tuple[str, dict]]
+    ) -> Iterator[tuple[str, dict, list[list[float]]]]:
+        """Yield records together with embeddings of their chunks, in order.
+
+        Embeddings for DEFAULT_EMBEDDING_CONCURRENCY records are requested
+        concurrently, with as many records queued behind them. Records are
+        split into chunks only when they are submitted, so only this bounded
+        window of chunked records is held in memory.
+        """
+        window = 2 * constants.DEFAULT_EMBEDDING_CONCURRENCY
+        pending: deque = deque()
+        with ThreadPoolExecutor(
+            max_workers=constants.DEFAULT_EMBEDDING_CONCURRENCY
+        ) as executor:
+            for record_id, record in keyed_records:
+                if len(pending) >= window:
+                    done_id, done_record, embeddings = pending.popleft()
+                    yield done_id, done_record, embeddings.result()
+
+                pending.append((record_id, record, executor.submit(
+                    self.get_embeddings, self.get_chunks(record))))
+
+            while pending:
+                done_id, done_record, embeddings = pending.popleft()
+                yield done_id, done_record, embeddings.result()
+
+    def _upsert_records(
+        self,
+        embedded_records: Iterable[tuple[str, dict, list[list[float]]]],
+        total: int,
+    ) -> None:
+        """Store embedded records in the database in batches.
+
+        Batches are sent from a worker thread, so that database round trips
+        overlap with computing embeddings for the following records. Only one
+        batch is in flight at a time, which keeps the batches in record order.
+        """
+        points = []
+        upsert = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for record_id, record, embeddings in tqdm(
+                embedded_records,
+                total=total,
+                desc="Processing embeddings",
+                disable=None,
+            ):
+                # Send points in batches to avoid one database round trip per record.
+                # Intermediate batches do not wait for the update to be applied.
+                # A full batch is only sent once another record follows it, so
+                # the last batch is never sent without waiting.
+                if len(points) >= constants.DEFAULT_UPSERT_BATCH_SIZE:
+                    # Re-raise errors of the previous batch before sending the next
+                    if upsert:
+                        upsert.result()
+                    upsert = executor.submit(
+                        self.db_manager.upsert_data,
+                        self.config["db_collection_name"], points, wait=False)
+                    points = []
+
+                self.record_postprocessing(record)
+                points.append(self.db_manager.build_record(
+                    record_id=record_id,
+                    payload=dict(record),
+                    vector=embeddings,
+                ))
+
+            if upsert:
+                upsert.result()
+
+        # Updates are applied in order, so waiting for the last batch also
+        # waits for the previous ones.
+        if points:
+            self.db_manager.upsert_data(self.config["db_collection_name"], points)
 
     def cleanup_records(
         self, records: list, backup: bool, backup_path: str
@@ -150,6 +283,36 @@ class Scraper:
 
         raise NotImplementedError
 
+    def _cleanup_records_with_pandas(
+        self, records: list, backup: bool, backup_path: str,
+        save_backup: Callable[[pd.DataFrame, str], None] = pd.DataFrame.to_pickle,
+    ) -> list[dict]:
+        """Drop records with missing values and records with duplicate text.
+
+        Shared implementation of `cleanup_records` for scrapers whose records
+        need no specific cleanup.
+
+        Args:
+            records: Records to clean up
+            backup: Save the cleaned up records to backup_path
+            backup_path: Path of the backup file
+            save_backup: Function writing the cleaned up DataFrame to a path
+        """
+        df = pd.DataFrame(records)
+
+        LOG.info("Records stats BEFORE cleanup: %d", df.shape[0])
+
+        df = df.dropna()
+        df = df.drop_duplicates(subset=["text"])
+
+        LOG.info("Records stats AFTER cleanup: %d", df.shape[0])
+
+        if backup:
+            LOG.info("Saving backup to: %s", backup_path)
+            save_backup(df, backup_path)
+
+        return df.to_dict(orient="records")
+
     def get_documents(self) -> List[dict]:
         """Retrieve original documents as a list of dictionaries."""
         raise NotImplementedError
@@ -182,7 +345,9 @@ class JiraScraper(Scraper):
     def __init__(self, config: Dict):
         super().__init__(config=config)
 
-        self.jira_client = JiraProvider(config["jira_url"], config["jira_token"])
+        self.jira_client = JiraProvider(
+            config["jira_url"], config["jira_token"], config["scraper_processes"]
+        )
 
     def build_query(self, projects: List[str], date_cutoff: datetime) -> str:
         """Build JQL query from project dictionary.
@@ -204,29 +369,48 @@ class JiraScraper(Scraper):
         return query
 
     def fetch_all_issues(self, query: str, max_results: int) -> List[Dict]:
-        """Fetch all issues matching the query."""
+        """Fetch all issues matching the query.
+
+        Issues are fetched in pages of up to DEFAULT_JIRA_PAGE_SIZE issues.
+        The server may cap the page size, in which case the size of the first
+        page is used for the remaining ones.
+
+        Args:
+            query: JQL query string
+            max_results: Maximum number of issues to fetch in total
+        """
         # Get initial batch to determine total count
-        initial_issues, total = self.jira_client.get_issues(query, max_results)
+        initial_issues, total = self.jira_client.get_issues(
+            query, min(constants.DEFAULT_JIRA_PAGE_SIZE, max_results))
 
         if not initial_issues:
             LOG.error("No jira tickets found!")
             return []
 
-        # Fetch remaining issues in parallel using a process pool executor
-        with mp.Pool(self.config["scraper_processes"]) as pool:
-            args = [(query, max_results, page) for page in range(1000, total, 1000)]
-
-            results = pool.starmap(self.jira_client.get_issues, args)
-
-        # Combine all issues
-        all_issues = initial_issues + [issue for batch in results for issue in batch[0]]
+        page_size = len(initial_issues)
+        total = min(total, max_results)
+
+        # Fetch remaining issues in parallel. Requests are I/O bound,
+        # so use threads instead of processes. Pages are appended as they
+        # are consumed so that each response can be released right away.
+        all_issues = initial_issues
+        start_offsets = range(page_size, total, page_size)
+        with ThreadPoolExecutor(max_workers=self.config["scraper_processes"]) as executor:
+            get_issues = partial(self.jira_client.get_issues, query, page_size)
+            for issues, _ in tqdm(executor.map(get_issues, start_offsets),
+                                  total=len(start_offsets),
+                                  desc="Fetching issues",
+                                  disable=None):
+                all_issues.extend(issues)
+
+        del all_issues[max_results:]
         return all_issues
 
     def get_records(self, documents: List[Dict]) -> list[JiraRecord]:
         """Convert Jira API responses to JiraRecords"""
         jira_records: list[JiraRecord] = []
 
-        for issue in tqdm(documents, desc="Processing issues"):
+        for issue in tqdm(documents, desc="Processing issues", disable=None):
             jira_url = f"{self.config['jira_url']}/browse/{issue['key']}"
 
             components = [
@@ -239,9 +423,10 @@ class JiraScraper(Scraper):
 
             versions = [version["name"] for version in issue["fields"]["versions"]]
 
-            comment_text = ""
-            for idx, comment in enumerate(issue["fields"]["comment"]["comments"]):
-                comment_text += f"### Comment no.{idx}\n" f"{comment['body']}\n\n"
+            comment_text = "".join(
+                f"### Comment no.{idx}\n{comment['body']}\n\n"
+                for idx, comment in enumerate(issue["fields"]["comment"]["comments"])
+            )
 
             # Concatenate all comments for a jira
             jira_text_format = """
@@ -300,22 +485,25 @@ class JiraScraper(Scraper):
         self, records: list[JiraRecord], backup: bool, backup_path: str
     ) -> list[JiraRecord]:
         """Cleanup Jira Records"""
-        df = pd.DataFrame(records)
+        LOG.info("Jira records stats BEFORE cleanup: %d", len(records))
 
-        LOG.info("Jira records stats BEFORE cleanup:")
-        LOG.info(df.info())
+        # Drop records with missing values and keep the first record for
+        # each text, deduplicating in one pass without building a DataFrame
+        records_by_text: dict[str, JiraRecord] = {}
+        for record in records:
+            if any(value is None for value in record.values()):
+                continue
+            records_by_text.setdefault(record["text"], record)
 
-        df = df.dropna()
-        df = df.drop_duplicates(subset=["text"])
+        records = list(records_by_text.values())
 
-        LOG.info("Jira records stats AFTER cleanup:")
-        LOG.info(df.info())
+        LOG.info("Jira records stats AFTER cleanup: %d", len(records))
 
         if backup:
             LOG.info("Saving backup to: %s", backup_path)
-            df.to_pickle(backup_path)
+            pd.DataFrame(records).to_pickle(backup_path)
 
-        return [JiraRecord(**row) for row in df.to_dict(orient="records")]
+        return records
 
 
 class OSPDocScraper(Scraper):
@@ -356,7 +544,7 @@ class OSPDocScraper(Scraper):
         """Convert Jira API responses to JiraRecords"""
         document_records: list[dict] = []
 
-        for document in tqdm(documents, desc="Processing documents"):
+        for document in tqdm(documents, desc="Processing documents", disable=None):
 
             document_records.append(
                 {
@@ -416,19 +604,4 @@ class OSPDocScraper(Scraper):
         self, records: list[dict], backup: bool, backup_path: str
     ) -> list[dict]:
         """Cleanup document records"""
-        df = pd.DataFrame(records)
-
-        LOG.info("Document records stats BEFORE cleanup:")
-        LOG.info(df.info())
-
-        df = df.dropna()
-        df = df.drop_duplicates(subset=["text"])
-
-        LOG.info("Document records stats AFTER cleanup:")
-        LOG.info(df.info())
-
-        if backup:
-            LOG.info("Saving backup to: %s", backup_path)
-            df.to_pickle(backup_path)
-
-        return [JiraRecord(**row) for row in df.to_dict(orient="records")]
+        return self._cleanup_records_with_pandas(records, backup, backup_path)
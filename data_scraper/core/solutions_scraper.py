@@ -47,7 +47,7 @@ class SolutionsScraper(Scraper):
     def get_records(self, documents: List[Dict]) -> list[SolutionsRecord]:
         """Convert Solution API responses to SolutionsRecord"""
         solutions_records: list[SolutionsRecord] = []
-        for raw_result in tqdm(documents, desc="Processing issues"):
+        for raw_result in tqdm(documents, desc="Processing issues", disable=None):
             solutions_records.append(
                 {
                     "kb_id": raw_result.get('id', ''),
@@ -78,17 +78,4 @@ class SolutionsScraper(Scraper):
     def cleanup_records(
         self, records: list, backup: bool, backup_path: str
     ) -> list:
-        df = pd.DataFrame(records)
-
-        LOG.info("Records stats BEFORE cleanup: %d", df.shape[0])
-
-        df = df.dropna()
-        df = df.drop_duplicates(subset=["text"])
-
-        LOG.info("Records stats AFTER cleanup: %d", df.shape[0])
-
-        if backup:
-            LOG.info("Saving backup to: %s", backup_path)
-            df.to_csv(backup_path)
-
-        return [SolutionsRecord(**row) for row in df.to_dict(orient="records")]
+        return self._cleanup_records_with_pandas(records, backup, backup_path, pd.DataFrame.to_csv)
@@ -25,12 +25,15 @@ def jira_scraper():
     parser.add_argument("--database_api_key", type=str, required=True)
 
     # Optional arguments
+    parser.add_argument("--database_prefer_grpc", action='store_true', default=False)
     parser.add_argument("--jira_url", type=str,
                         default=constants.DEFAULT_JIRA_URL)
     parser.add_argument("--max_results", type=int,
                         default=constants.DEFAULT_MAX_RESULTS)
     parser.add_argument("--chunk_size", type=int,
                         default=constants.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--chunk_overlap", type=int,
+                        default=constants.DEFAULT_CHUNK_OVERLAP)
     parser.add_argument("--embedding_model", type=str,
                         default=constants.DEFAULT_EMBEDDING_MODEL)
     parser.add_argument("--jira_projects", nargs='+', type=str,
@@ -60,9 +63,11 @@ def jira_scraper():
         "llm_server_url": args.llm_server_url,
         "llm_api_key": args.llm_api_key,
         "database_api_key": args.database_api_key,
+        "database_prefer_grpc": args.database_prefer_grpc,
         "jira_url": args.jira_url,
         "max_results": args.max_results,
         "chunk_size": args.chunk_size,
+        "chunk_overlap": args.chunk_overlap,
         "embedding_model": args.embedding_model,
         "jira_projects": args.jira_projects,
         "db_collection_name": args.db_collection_name,
@@ -94,8 +99,11 @@ def osp_doc_scraper():
         )
 
     # Optional arguments
+    parser.add_argument("--database_prefer_grpc", action='store_true', default=False)
     parser.add_argument("--chunk_size", type=int,
                         default=constants.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--chunk_overlap", type=int,
+                        default=constants.DEFAULT_CHUNK_OVERLAP)
     parser.add_argument("--embedding_model", type=str,
                         default=constants.DEFAULT_EMBEDDING_MODEL)
     parser.add_argument("--db_collection_name", type=str,
@@ -117,7 +125,9 @@ def osp_doc_scraper():
         "llm_server_url": args.llm_server_url,
         "llm_api_key": args.llm_api_key,
         "database_api_key": args.database_api_key,
+        "database_prefer_grpc": args.database_prefer_grpc,
         "chunk_size": args.chunk_size,
+        "chunk_overlap": args.chunk_overlap,
         "embedding_model": args.embedding_model,
         "db_collection_name": args.db_collection_name,
         "docs_location": args.docs_location,
@@ -145,10 +155,13 @@ def errata_scraper() -> None:
     parser.add_argument("--kerberos-password", type=str, required=True)
 
     # Optional arguments
+    parser.add_argument("--database_prefer_grpc", action='store_true', default=False)
     parser.add_argument("--jira_url", type=str,
                         default=constants.DEFAULT_JIRA_URL)
     parser.add_argument("--chunk_size", type=int,
                         default=constants.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--chunk_overlap", type=int,
+                        default=constants.DEFAULT_CHUNK_OVERLAP)
     parser.add_argument("--embedding_model", type=str,
                         default=constants.DEFAULT_EMBEDDING_MODEL)
     parser.add_argument("--db_collection_name", type=str,
@@ -180,7 +193,9 @@ def errata_scraper() -> None:
         "llm_server_url": args.llm_server_url,
         "llm_api_key": args.llm_api_key,
         "database_api_key": args.database_api_key,
+        "database_prefer_grpc": args.database_prefer_grpc,
         "chunk_size": args.chunk_size,
+        "chunk_overlap": args.chunk_overlap,
         "embedding_model": args.embedding_model,
         "db_collection_name": args.db_collection_name,
         "kerberos_username": args.kerberos_username,
@@ -212,8 +227,11 @@ def ci_logs_scraper() -> None:
     parser.add_argument("--zuul_url", type=str, required=True)
 
     # Optional arguments
+    parser.add_argument("--database_prefer_grpc", action='store_true', default=False)
     parser.add_argument("--chunk_size", type=int,
                         default=constants.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--chunk_overlap", type=int,
+                        default=constants.DEFAULT_CHUNK_OVERLAP)
     parser.add_argument("--embedding_model", type=str,
                         default=constants.DEFAULT_EMBEDDING_MODEL)
     parser.add_argument("--db_collection_name", type=str,
@@ -244,7 +262,9 @@ def ci_logs_scraper() -> None:
         "llm_server_url": args.llm_server_url,
         "llm_api_key": args.llm_api_key,
         "database_api_key": args.database_api_key,
+        "database_prefer_grpc": args.database_prefer_grpc,
         "chunk_size": args.chunk_size,
+        "chunk_overlap": args.chunk_overlap,
         "embedding_model": args.embedding_model,
         "db_collection_name": args.db_collection_name,
         "zuul_url": args.zuul_url,
@@ -259,13 +279,13 @@ def ci_logs_scraper() -> None:
 
 
 
-    tenant = list(constants.DEFAULT_ZULL_TENANTS)[0] # just one tenenat is testsed ATM
-    pipelines = list(constants.DEFAULT_ZULL_PIPELINES) # Just RHOSO pipelines are tested ATM
+    tenants = sorted(args.tenants)
+    pipelines = sorted(args.pipelines)
 
     if not args.populate_db_from_json:
     # Get test operator reports, save tracebacks and create json
         provider = TestOperatorReportsProvider(args.zuul_url,
-                                            tenant,
+                                            tenants,
                                             pipelines,
                                             config_args["tracebacks_json"])
         provider.run()
@@ -287,12 +307,15 @@ def solutions_scraper() -> None:
     parser.add_argument("--solutions-token", type=str, required=True)
 
     # Optional arguments
+    parser.add_argument("--database_prefer_grpc", action='store_true', default=False)
     parser.add_argument("--solutions-url", type=str,
                         default=constants.DEFAULT_SOLUTIONS_PUBLIC_URL)
     parser.add_argument("--max_results", type=int,
                         default=constants.SOLUTIONS_MAX_RESULTS)
     parser.add_argument("--chunk_size", type=int,
                         default=constants.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--chunk_overlap", type=int,
+                        default=constants.DEFAULT_CHUNK_OVERLAP)
     parser.add_argument("--embedding_model", type=str,
                         default=constants.DEFAULT_EMBEDDING_MODEL)
     parser.add_argument("--db_collection_name", type=str,
@@ -312,7 +335,9 @@ def solutions_scraper() -> None:
         "llm_server_url": args.llm_server_url,
         "llm_api_key": args.llm_api_key,
         "database_api_key": args.database_api_key,
+        "database_prefer_grpc": args.database_prefer_grpc,
         "chunk_size": args.chunk_size,
+        "chunk_overlap": args.chunk_overlap,
         "embedding_model": args.embedding_model,
         "db_collection_name": args.db_collection_name,
         "solutions_url": args.solutions_url,
@@ -1,19 +1,24 @@
 """Code for test operator logs data provisioning"""
 # Standard library imports
-import asyncio
+import atexit
+import itertools
 import json
 import logging
 import os
 import re
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import httpx
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from httpx_gssapi import HTTPSPNEGOAuth
 from httpx_gssapi.gssapi_ import OPTIONAL
 
+from data_scraper.common import constants
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -37,10 +42,54 @@ TEST_OPERATOR_PATH = "logs/controller-0/ci-framework-data/tests/test_operator"
 TEMPEST_TEST_PATTERN = "tempest-"
 TOBIKO_TEST_PATTERN = "tobiko-"
 
+# Id of tempest report rows describing a failed test, e.g. ft1.23
+FAILED_TEST_ROW_ID_REGEX = re.compile(r'^ft\d+\.\d+')
+
+# Tempest test name patterns, compiled once as they are used for every failed test
+TEST_NAME_REGEX = re.compile(r'ft\d+\.\d+:\s*(.*?)\)?testtools')
+TEST_NAME_FALLBACK_REGEX = re.compile(r'ft\d+\.\d+:\s*(.*?)$')
+SQUARE_BRACKETS_REGEX = re.compile(r'\[.*?\]')
+PARENTHESES_REGEX = re.compile(r'\(.*?\)')
+
+# The C based lxml parser is considerably faster than the pure Python
+# html.parser on large tempest reports
+HTML_PARSER = "lxml"
+
+# Only the parts of the pages we read are turned into a parse tree:
+# result rows of tempest reports and links of directory listings
+TEMPEST_ROW_STRAINER = SoupStrainer('tr')
+LINK_STRAINER = SoupStrainer('a', href=True)
+
 # Define output directory for files (using /tmp for OpenShift compatibility)
 OUTPUT_DIR = "/tmp"
 
-async def fetch_with_gssapi(url, params=None, timeout=30.0):
+# HTTP client shared by all requests, see _get_http_client
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+def _get_http_client():
+    """
+    Get the HTTP client shared by all requests, creating it on first use.
+
+    Reusing a single client keeps connections to the Zuul and log servers
+    alive across requests and threads instead of opening new ones for
+    every page. The client is closed when the interpreter exits.
+
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _HTTP_CLIENT  # pylint: disable=global-statement
+
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            # Certificates are not verified, silence the warning once here
+            # rather than on every request
+            warnings.filterwarnings('ignore', message='Unverified HTTPS request')
+            _HTTP_CLIENT = httpx.Client(verify=False, follow_redirects=True)
+            atexit.register(_HTTP_CLIENT.close)
+        return _HTTP_CLIENT
+
+def fetch_with_gssapi(url, params=None, timeout=30.0):
     """
     Fetch content using Kerberos authentication.
 
@@ -50,22 +99,18 @@ async def fetch_with_gssapi(url, params=None, timeout=30.0):
         timeout: Request timeout in seconds
 
     Returns:
-        Response text content
+        Response object with the body already read
     """
-    async with httpx.AsyncClient(
-        verify=False,
-        follow_redirects=True,
-        timeout=timeout
-    ) as session:
-        response = await session.get(
-            url,
-            params=params,
-            auth=HTTPSPNEGOAuth(mutual_authentication=OPTIONAL)
-        )
-        response.raise_for_status()
-        return response.text
-
-def make_authenticated_request(url, params=None, timeout=30.0):
+    response = _get_http_client().get(
+        url,
+        params=params,
+        timeout=timeout,
+        auth=HTTPSPNEGOAuth(mutual_authentication=OPTIONAL)
+    )
+    response.raise_for_status()
+    return response
+
+def make_authenticated_request(url, params=None, timeout=30.0, parse_json=False):
     """
     Make an authenticated request to a URL using multiple authentication methods.
 
@@ -73,19 +118,22 @@ def make_authenticated_request(url, params=None, timeout=30.0):
         url: URL to fetch
         params: Optional query parameters
         timeout: Request timeout in seconds
+        parse_json: Parse the response body as JSON
 
     Returns:
-        Response content as text, or None if an error occurs
-        For JSON responses, the caller will need to parse the text
+        Response content as text, or parsed JSON if parse_json is set,
+        or None if an error occurs
     """
-    warnings.filterwarnings('ignore', message='Unverified HTTPS request')
-
     # First try with Kerberos
     try:
-        LOG.info("Attempting to authenticate using Kerberos...")
-        content = asyncio.run(fetch_with_gssapi(url, params, timeout))
-        LOG.info("Kerberos authentication successful")
-        return content
+        LOG.debug("Attempting to authenticate using Kerberos...")
+        response = fetch_with_gssapi(url, params, timeout)
+        LOG.debug("Kerberos authentication successful")
+
+        if parse_json:
+            # Parse the raw body, decoding it to str first would copy it
+            return json.loads(response.content)
+        return response.text
 
     except (httpx.HTTPError, httpx.RequestError, httpx.TimeoutException) as e:
         LOG.warning("Kerberos authentication failed due to HTTP error: %s", e)
@@ -108,7 +156,8 @@ class TempestResultsParser:
         self.source = source
         self.html_content = self._get_content(source)
         if self.html_content:
-            self.soup = BeautifulSoup(self.html_content, 'html.parser')
+            self.soup = BeautifulSoup(self.html_content, HTML_PARSER,
+                                      parse_only=TEMPEST_ROW_STRAINER)
         return self
 
     def _get_content(self, source):
@@ -140,14 +189,14 @@ class TempestResultsParser:
     def _extract_test_name(self, test_name_part: str) -> str:
         """Extract the test name from the text before the traceback."""
         # Extract the test name using a regex pattern
-        test_name_match = re.search(r'ft\d+\.\d+:\s*(.*?)\)?testtools', test_name_part)
+        test_name_match = TEST_NAME_REGEX.search(test_name_part)
         if test_name_match:
             test_name = test_name_match.group(1).strip()
             if test_name.endswith('('):
                 test_name = test_name[:-1].strip()
         else:
             # Try alternative pattern for different formats
-            test_name_match = re.search(r'ft\d+\.\d+:\s*(.*?)$', test_name_part)
+            test_name_match = TEST_NAME_FALLBACK_REGEX.search(test_name_part)
             if test_name_match:
                 test_name = test_name_match.group(1).strip()
             else:
@@ -156,10 +205,10 @@ class TempestResultsParser:
         # Remove any content within square brackets
         # e.g. test_tagged_boot_devices[id-a2e65a6c,image,network,slow,volume]
         # becomes test_tagged_boot_devices
-        test_name = re.sub(r'\[.*?\]', '', test_name).strip()
+        test_name = SQUARE_BRACKETS_REGEX.sub('', test_name).strip()
 
         # Remove any content within parentheses
-        test_name = re.sub(r'\(.*?\)', '', test_name).strip()
+        test_name = PARENTHESES_REGEX.sub('', test_name).strip()
 
         return test_name
 
@@ -172,7 +221,7 @@ class TempestResultsParser:
         # https://github.com/RCAccelerator/chatbot/. Get rid
         # of duplication at some stage. ATM it's a QnD solution to have exaclty the same
         # parsing of tempest test reports both at the endpoint and in scraper.
-        failed_test_rows = soup.find_all('tr', id=re.compile(r'^ft\d+\.\d+'))
+        failed_test_rows = soup.find_all('tr', id=FAILED_TEST_ROW_ID_REGEX)
 
         for row in failed_test_rows:
             row_text = row.get_text().strip()
@@ -203,24 +252,25 @@ class TempestResultsParser:
         if not self.failed_tests:
             return "No failed tests found."
 
-        summary = f"Found {len(self.failed_tests)} failed tests:\n"
-        for test_name, _ in self.failed_tests:
-            summary += f"- {test_name}\n"
+        summary = [f"Found {len(self.failed_tests)} failed tests:\n"]
+        summary.extend(f"- {test_name}\n" for test_name, _ in self.failed_tests)
 
-        return summary
+        return "".join(summary)
 
 
 class ZuulClient:
     """Client for fetching Zuul build data and analyzing test reports."""
 
-    def __init__(self, base_url):
+    def __init__(self, base_url, max_workers=constants.DEFAULT_NUM_SCRAPER_PROCESSES):
         """
         Initialize the client with the base URL.
 
         Args:
             base_url: Base URL for the Zuul server
+            max_workers: Maximum number of builds processed concurrently
         """
         self.base_url = base_url.rstrip('/')
+        self.max_workers = max_workers
 
     def retrive_failed_builds(self, tenant, pipeline, limit=FILTER_LIMIT):
         """
@@ -246,11 +296,11 @@ class ZuulClient:
         LOG.info("Fetching data from: %s with params: %s", url, params)
 
         try:
-            content_text = make_authenticated_request(url, params=params, timeout=60.0)
-            if not content_text:
+            result = make_authenticated_request(url, params=params, timeout=60.0,
+                                                parse_json=True)
+            if not result:
                 return []
 
-            result = json.loads(content_text)
             LOG.info("Successfully fetched %d builds", len(result))
 
             filtered_builds = self._filter_builds_by_date(result)
@@ -282,18 +332,10 @@ class ZuulClient:
             if not end_time:
                 continue
 
-            # Parse the timestamp
+            # Parse the timestamp, fromisoformat handles the simple format as
+            # well as timezone offsets and the Z suffix for UTC
             try:
-                # Handle different timestamp formats
-                if 'Z' in end_time:
-                    # ISO format with Z for UTC
-                    build_time = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                elif 'T' in end_time and '+' in end_time:
-                    # ISO format with timezone offset
-                    build_time = datetime.fromisoformat(end_time)
-                else:
-                    # Assume simple format
-                    build_time = datetime.fromisoformat(end_time)
+                build_time = datetime.fromisoformat(end_time)
 
                 # Include only builds newer than the cutoff time
                 if build_time >= CUTOFF_TIME:
@@ -316,7 +358,7 @@ class ZuulClient:
         Returns:
             HTML content as string, or None if an error occurs
         """
-        LOG.info("Fetching HTML from: %s", url)
+        LOG.debug("Fetching HTML from: %s", url)
         return make_authenticated_request(url)
 
     def find_test_reports(self, builds_json):
@@ -330,6 +372,7 @@ class ZuulClient:
             Dictionary mapping build UUIDs to test report information
         """
         results = {}
+        builds = []
 
         for build in builds_json:
             build_uuid = build.get("uuid", "unknown")
@@ -341,7 +384,15 @@ class ZuulClient:
 
             LOG.info("Processing build %s with log URL %s", build_uuid, log_url)
 
-            results[build_uuid] = self._process_build_reports(log_url)
+            builds.append((build_uuid, log_url))
+
+        # Builds are independent and fetching their reports is I/O bound,
+        # so process them concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            reports = executor.map(self._process_build_reports,
+                                   [log_url for _, log_url in builds])
+            for (build_uuid, _), report in zip(builds, reports):
+                results[build_uuid] = report
 
         return results
 
@@ -400,7 +451,7 @@ class ZuulClient:
 
     def _find_test_directories(self, html_content):
         """Find test directories in HTML content."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=LINK_STRAINER)
         test_dirs = []
 
         for link in soup.find_all("a", href=True):
@@ -475,15 +526,16 @@ class ZuulClient:
             LOG.info("Could not access directory: %s", directory_url)
             return html_files
 
-        dir_soup = BeautifulSoup(dir_html, "html.parser")
+        dir_soup = BeautifulSoup(dir_html, HTML_PARSER, parse_only=LINK_STRAINER)
 
         for link in dir_soup.find_all("a", href=True):
             href = link["href"]
             if href.endswith(".html") and not href.startswith("/"):
                 html_url = f"{directory_url}/{href}"
                 html_files.append(html_url)
-                LOG.info("Found HTML file: %s", html_url)
+                LOG.debug("Found HTML file: %s", html_url)
 
+        LOG.info("Found %d HTML files in %s", len(html_files), directory_url)
         return html_files
 
 
@@ -549,17 +601,17 @@ def create_tempest_failures_json(report_results, tracebacks_json):
 class TestOperatorReportsProvider:
     """Class responsible for retrieving and processing test operator reports."""
 
-    def __init__(self, server_url, tenant, pipelines, tracebacks_json):
+    def __init__(self, server_url, tenants, pipelines, tracebacks_json):
         """Initialize the TestOperatorReportsProvider with a server URL.
 
         Args:
             server_url (str): The URL of the Zuul server.
-            tenant (str): The tenant name.
+            tenants (list): A list of tenant names.
             pipelines (list): A list of pipeline names.
             tracebacks_json (str): Path to the tracebacks JSON file.
         """
         self.server_url = server_url
-        self.tenant = tenant
+        self.tenants = tenants
         self.pipelines = pipelines
 
         if not tracebacks_json.startswith('/'):
@@ -583,30 +635,30 @@ class TestOperatorReportsProvider:
         """Entry point of TestOperatorReportsProvider.
         """
         server_url = self.server_url
-        tenant = self.tenant
 
         client = ZuulClient(server_url)
 
         all_builds = []
 
-        for pipeline in self.pipelines:
-            LOG.info("Processing pipeline: %s", pipeline)
+        for tenant, pipeline in itertools.product(self.tenants, self.pipelines):
+            LOG.info("Processing pipeline: %s (tenant: %s)", pipeline, tenant)
             builds = client.retrive_failed_builds(tenant, pipeline)
 
             if not builds:
-                LOG.warning("No builds found for pipeline %s", pipeline)
+                LOG.warning("No builds found for pipeline %s (tenant: %s)", pipeline, tenant)
                 continue
 
-            LOG.info("Found %d failed builds in pipeline %s within the last 2 weeks (after %s)",
-                    len(builds), pipeline, CUTOFF_TIME.isoformat())
+            LOG.info("Found %d failed builds in pipeline %s (tenant: %s) within the last "
+                     "2 weeks (after %s)", len(builds), pipeline, tenant, CUTOFF_TIME.isoformat())
 
             all_builds.extend(builds)
 
-            with open(self.failed_builds_file, "a", encoding='utf-8') as f:
-                for build in builds:
-                    f.write(f"{build}\n")
+            # Raw build dumps are only useful for debugging and can be large
+            if LOG.isEnabledFor(logging.DEBUG):
+                with open(self.failed_builds_file, "a", encoding='utf-8') as f:
+                    f.writelines(f"{build}\n" for build in builds)
 
-            LOG.info("Updated failed builds in %s", self.failed_builds_file)
+                LOG.debug("Updated failed builds in %s", self.failed_builds_file)
 
         report_results = client.find_test_reports(all_builds)
 
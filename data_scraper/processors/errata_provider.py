@@ -1,6 +1,8 @@
 """Client to fetch Erratas."""
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from requests_kerberos import HTTPKerberosAuth, OPTIONAL
 
@@ -10,9 +12,21 @@ LOG.setLevel(logging.INFO)
 class ErrataProvider:
     """Provider for JIRA."""
 
-    def __init__(self, query_url: str):
+    def __init__(self, query_url: str, max_connections: int = 10):
         self.query_url = query_url
 
+        # Reuse connections to the errata server across requests. The pool
+        # is sized so that concurrent callers do not discard connections.
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_maxsize=max_connections,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.1,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ))
+
     def search_erratas(self, product_ids: list[int], page: int = 1) -> dict:
         """Search erratas related to given product IDs with pagination support.
 
@@ -23,19 +37,16 @@ class ErrataProvider:
         Returns:
             dict: Containing response from the /api/v1/erratum/search endpoint.
         """
-        query = f"{self.query_url}/api/v1/erratum/search?"
-
-        params = []
-        for product_id in product_ids:
-            params.append(f"product[]={product_id}")
-        params.append(f"page={page}")
-
-        query = f"{query}{"&".join(params)}"
-        LOG.info("Sending the following request to errata -> %s", query)
+        query = f"{self.query_url}/api/v1/erratum/search"
+        # Query parameters are URL-encoded by requests, lists are sent as
+        # repeated product[] parameters
+        params = {"product[]": product_ids, "page": page}
+        LOG.info("Sending the following request to errata -> %s %s", query, params)
 
         try:
             auth = HTTPKerberosAuth(mutual_authentication=OPTIONAL)
-            response = requests.get(query, auth=auth, verify=False, timeout=(3.05, 180))
+            response = self.session.get(query, params=params, auth=auth, verify=False,
+                                        timeout=(3.05, 180))
         except requests.exceptions.Timeout:
             LOG.error("Request to errata %s timed out.", query)
             return {}
@@ -61,7 +72,7 @@ class ErrataProvider:
 
         try:
             auth = HTTPKerberosAuth(mutual_authentication=OPTIONAL)
-            response = requests.get(query, auth=auth, verify=False, timeout=(3.05, 180))
+            response = self.session.get(query, auth=auth, verify=False, timeout=(3.05, 180))
         except requests.exceptions.Timeout:
             LOG.error("Request to errata %s timed out.", query)
             return {}
@@ -10,6 +10,9 @@ import urllib3 as http
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.INFO)
 
+# Issue fields used by the scrapers, "id" and "key" are always returned
+ISSUE_FIELDS = "summary,description,comment,components,fixVersions,versions"
+
 # pylint: disable=too-few-public-methods
 class IssueProvider(abc.ABC):
     """Abstract class defining `IssueProvider` interface."""
@@ -24,8 +27,12 @@ class IssueProvider(abc.ABC):
 class JiraProvider(IssueProvider):
     """Provider for JIRA."""
 
-    def __init__(self, query_url: str, query_token: str):
+    def __init__(self, query_url: str, query_token: str, max_connections: int = 10):
         self.query_url = query_url
+
+        # Reuse connections to the Jira server across requests. The pool
+        # is sized so that concurrent callers do not discard connections.
+        self.pool_manager = http.PoolManager(maxsize=max_connections)
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -45,19 +52,23 @@ class JiraProvider(IssueProvider):
             max_results: Maximum number of tickets that should be retrieved
             start_at: Specififes which chunk of tickets you want to download.
         """
-        full_url = (
-            f"{self.query_url}/rest/api/2/search?"
-            f"jql={query}&maxResults={max_results}&"
-            f"fields=*all&startAt={start_at}"
-        )
+        search_url = f"{self.query_url}/rest/api/2/search"
+        # Query parameters are URL-encoded by urllib3
+        search_params = {
+            "jql": query,
+            "maxResults": max_results,
+            "fields": ISSUE_FIELDS,
+            "startAt": start_at,
+        }
 
         LOG.info("Processing Jira request [query: %s, max_results: %d, "
                  "start_at: %d]", query, max_results, start_at)
 
         try:
-            response = http.request(
+            response = self.pool_manager.request(
                 method="GET",
-                url=full_url,
+                url=search_url,
+                fields=search_params,
                 headers=self.headers,
                 timeout=http.Timeout(connect=3.05, read=180),
                 retries=http.Retry(
@@ -74,7 +85,8 @@ class JiraProvider(IssueProvider):
             LOG.error("Error fetching JIRA data: %s", e)
             return ([], 0)
 
-        parsed_response = json.loads(response.data.decode("utf-8"))
+        # Parse the raw body, decoding it to str first would copy it
+        parsed_response = json.loads(response.data)
 
         LOG.info("Found %d Jira tickets matching the query and retrieved %d " \
                  "of them. [query: %s, max_results: %d, start_at: %d]",
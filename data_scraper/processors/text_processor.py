@@ -20,12 +20,13 @@ class TextProcessor(ContentProcessor):
     """Handles text processing."""
 
     def __init__(self, embedding_model: str,
-                 chunk_size: int):
+                 chunk_size: int,
+                 chunk_overlap: int = 0):
         self.tokenizer = AutoTokenizer.from_pretrained(embedding_model)
         self.splitter = rct.from_huggingface_tokenizer(
             self.tokenizer,
             chunk_size=chunk_size,
-            chunk_overlap=0
+            chunk_overlap=chunk_overlap
         )
 
     def split_text(self, text: str) -> List[str]:
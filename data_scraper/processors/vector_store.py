@@ -14,7 +14,8 @@ class VectorStoreManager(abc.ABC):
 
     @abc.abstractmethod
     def upsert_data(self, collection_name: str,
-                    points: List[any]):
+                    points: List[any],
+                    wait: bool = True):
         """Upsert data into the collection."""
 
     @abc.abstractmethod
@@ -31,8 +32,23 @@ class VectorStoreManager(abc.ABC):
 class QdrantVectorStoreManager(VectorStoreManager):
     """Manages interactions with Qdrant database."""
 
-    def __init__(self, client_url: str, api_key: str, timeout=100):
-        self.client = QdrantClient(client_url, api_key=api_key, timeout=timeout)
+    def __init__(self, client_url: str, # pylint: disable=too-many-arguments
+                 api_key: str,
+                 timeout=100,
+                 prefer_grpc: bool = False,
+                 grpc_port: int = 6334):
+        """Create Qdrant client.
+
+        Args:
+            client_url: URL of the Qdrant server
+            api_key: API key for the Qdrant server
+            timeout: Request timeout in seconds
+            prefer_grpc: Use the gRPC interface instead of REST where possible.
+                Requires the gRPC port of the server to be reachable.
+            grpc_port: Port of the gRPC interface
+        """
+        self.client = QdrantClient(client_url, api_key=api_key, timeout=timeout,
+                                   prefer_grpc=prefer_grpc, grpc_port=grpc_port)
 
     def recreate_collection(self, collection_name: str, vector_size: int):
         """Recreate the collection with specified parameters, preserving a snapshot first."""
@@ -57,11 +73,17 @@ class QdrantVectorStoreManager(VectorStoreManager):
         return self.client.collection_exists(collection_name)
 
     def upsert_data(self, collection_name: str,
-                    points: List[models.PointStruct]):
-        """Upsert data into the collection."""
+                    points: List[models.PointStruct],
+                    wait: bool = True):
+        """Upsert data into the collection.
+
+        When wait is False the request returns as soon as the update is
+        accepted by the server instead of after it has been applied.
+        """
         self.client.upsert(
             collection_name=collection_name,
             points=points,
+            wait=wait,
         )
 
     def get_collection_stats(self, collection_name: str) -> Dict:
@@ -43,18 +43,15 @@ async def _calculate_cosine_similarity(llm: AsyncOpenAI,
                                       text1: str,
                                       text2: str) -> float:
 
-    emb1 = await llm.embeddings.create(
+    # Embed both texts in a single request, matching results to inputs
+    # by their index
+    embeddings = await llm.embeddings.create(
         model=model_name,
-        input=text1)
-    emb1 = emb1.data[0].embedding
-
-    emb2 = await llm.embeddings.create(
-        model=model_name,
-        input=text2)
-    emb2 = emb2.data[0].embedding
-
-    vec1 = np.array(emb1)
-    vec2 = np.array(emb2)
+        input=[text1, text2])
+    vectors = [None, None]
+    for data in embeddings.data:
+        vectors[data.index] = np.array(data.embedding)
+    vec1, vec2 = vectors
 
     norm1 = np.linalg.norm(vec1)
     norm2 = np.linalg.norm(vec2)
@@ -69,7 +66,7 @@ async def _calculate_cosine_similarity(llm: AsyncOpenAI,
 async def _process_row(client: httpx.AsyncClient, # pylint: disable=too-many-arguments
                       llm: AsyncOpenAI,
                       idx: int,
-                      row: pd.Series,
+                      row: dict,
                       args: argparse.Namespace,
                       model_name: str) -> dict:
     # Call the API
@@ -211,9 +208,6 @@ async def _main_async(): #pylint: disable=too-many-statements, too-many-locals
         api_key=args.llm_api_key
     )
 
-    avg_semantic_similarity = []
-    avg_hit_at_k = []
-
     try:
         df = pd.read_csv(args.input)
 
@@ -230,7 +224,7 @@ async def _main_async(): #pylint: disable=too-many-statements, too-many-locals
 
         async with httpx.AsyncClient() as client:
             tasks = []
-            for idx, row in df.iterrows():
+            for idx, row in zip(df.index, df.to_dict("records")):
                 task = _process_row(client, llm, idx, row, args, model_name)
                 tasks.append(task)
 
@@ -248,27 +242,26 @@ async def _main_async(): #pylint: disable=too-many-statements, too-many-locals
                 result = await f
                 results.append(result)
 
-        # Update dataframe with results
-        for result in results:
-            idx = result["idx"]
-            if result["response"]:
-                df.loc[idx, 'chatbot_response'] = result["response"]
-
-            if result["similarity_score"]:
-                df.loc[idx, 'similarity_score'] = result["similarity_score"]
-                avg_semantic_similarity.append(result["similarity_score"])
-
-            if result["hit_at_k"]:
-                df.loc[idx, 'hit_at_k'] = result["hit_at_k"]
-                avg_hit_at_k.append(result["hit_at_k"])
-
-        if avg_semantic_similarity:
-            avg_sim_score = sum(avg_semantic_similarity)/len(avg_semantic_similarity)
-            print(f"Average semantic similarity score: {avg_sim_score}")
-
-        if avg_hit_at_k:
-            avg_hit_score = sum(avg_hit_at_k)/len(avg_hit_at_k)
-            print(f"Average Hit @ {args.num_k} score: {avg_hit_score}")
+        # Update dataframe with results, assigning each column at once
+        # instead of growing it cell by cell
+        responses = pd.Series(
+            {r["idx"]: r["response"] for r in results if r["response"]}, dtype=object)
+        similarity_scores = pd.Series(
+            {r["idx"]: r["similarity_score"] for r in results if r["similarity_score"]},
+            dtype=float)
+        hits_at_k = pd.Series(
+            {r["idx"]: r["hit_at_k"] for r in results if r["hit_at_k"]}, dtype=float)
+
+        if not responses.empty:
+            df['chatbot_response'] = responses
+
+        if not similarity_scores.empty:
+            df['similarity_score'] = similarity_scores
+            print(f"Average semantic similarity score: {similarity_scores.mean()}")
+
+        if not hits_at_k.empty:
+            df['hit_at_k'] = hits_at_k
+            print(f"Average Hit @ {args.num_k} score: {hits_at_k.mean()}")
 
     except Exception as e: #pylint: disable=broad-exception-caught
         # Catch any exception
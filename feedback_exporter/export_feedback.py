@@ -1,14 +1,60 @@
 """Feedback export module."""
 import os
+import csv
 import json
+import threading
+from itertools import islice
 from urllib.parse import urlparse
 
-import pandas as pd
 import psycopg2
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 
+FETCH_BATCH_SIZE = 10000
+
+FEEDBACK_QUERY = """
+SELECT
+  f."value" AS score,
+  CONCAT(%s, s."threadId") AS thread_url,
+  s."input" AS step_input,
+  child."output" AS step_output,
+  f."comment",
+  u."identifier" AS user_name,
+  t."metadata"->'settings' AS settings
+FROM
+  "Feedback" f
+JOIN
+  "Step" s ON f."stepId" = s."id"
+JOIN
+  "Step" child ON child."parentId" = s."id"
+JOIN
+  "Thread" t ON s."threadId" = t."id"
+JOIN
+  "User" u ON t."userId" = u."id"
+"""
+
+def _copy_to_pipe(conn, copy_query, write_fd, errors):
+    """Write the output of a COPY ... TO STDOUT query into a pipe.
+
+    Runs in a background thread. Errors are appended to errors so that
+    they can be re-raised by the reading side.
+    """
+    try:
+        with open(write_fd, 'w', encoding='utf-8', newline='') as pipe, \
+                conn.cursor() as cursor:
+            cursor.copy_expert(copy_query, pipe)
+    except Exception as e: # pylint: disable=broad-exception-caught
+        errors.append(e)
+
 def _fetch_feedback_data(database_url, app_base_url):
+    """Stream feedback rows from the database.
+
+    PostgreSQL renders the query result to CSV with COPY ... TO STDOUT.
+    The output is written into a pipe by a background thread and read back
+    here in batches of FETCH_BATCH_SIZE rows of strings, so only a bounded
+    part of the export is held in memory. The first batch starts with the
+    header row.
+    """
     parsed = urlparse(database_url)
     conn = psycopg2.connect(
         dbname=parsed.path.lstrip('/'),
@@ -18,49 +64,52 @@ def _fetch_feedback_data(database_url, app_base_url):
         port=parsed.port
     )
 
-    query = """
-    SELECT
-      f."value" AS score,
-      CONCAT(%s, s."threadId") AS thread_url,
-      s."input" AS step_input,
-      child."output" AS step_output,
-      f."comment",
-      u."identifier" AS user_name,
-      t."metadata" AS settings
-    FROM
-      "Feedback" f
-    JOIN
-      "Step" s ON f."stepId" = s."id"
-    JOIN
-      "Step" child ON child."parentId" = s."id"
-    JOIN
-      "Thread" t ON s."threadId" = t."id"
-    JOIN
-      "User" u ON t."userId" = u."id";
-    """
+    try:
+        with conn.cursor() as cursor:
+            query = cursor.mogrify(FEEDBACK_QUERY, (app_base_url,)).decode()
 
-    df = pd.read_sql_query(query, conn, params=(app_base_url,))
-    df["settings"] = df["settings"].apply(lambda value: value["settings"])
+        read_fd, write_fd = os.pipe()
+        errors = []
+        copy_thread = threading.Thread(
+            target=_copy_to_pipe,
+            args=(conn, f"COPY ({query}) TO STDOUT WITH CSV HEADER", write_fd, errors)
+        )
+        copy_thread.start()
 
-    conn.close()
-    return df
+        # Closing the read end early makes the COPY fail with a broken pipe,
+        # so the thread always finishes
+        try:
+            with open(read_fd, 'r', encoding='utf-8', newline='') as pipe:
+                reader = csv.reader(pipe)
+                while batch := list(islice(reader, FETCH_BATCH_SIZE)):
+                    yield batch
+        finally:
+            copy_thread.join()
 
-def _write_to_google_sheet(df, spreadsheet_id, credentials_json):
+        if errors:
+            raise errors[0]
+    finally:
+        conn.close()
+
+def _write_to_google_sheet(batches, spreadsheet_id, credentials_json):
     creds_dict = json.loads(credentials_json)
     credentials = Credentials.from_service_account_info(creds_dict)
     service = build('sheets', 'v4', credentials=credentials)
 
-    sheet_data = [df.columns.tolist()] + df.astype(str).values.tolist()
-    body = {'values': sheet_data}
+    row_index = 1
+    for batch in batches:
+        body = {'values': batch}
+
+        # pylint: disable=no-member
+        service.spreadsheets().values().update(
+            spreadsheetId=spreadsheet_id,
+            range=f'A{row_index}',
+            valueInputOption='RAW',
+            body=body
+        ).execute()
+        # pylint: enable=no-member
 
-    # pylint: disable=no-member
-    service.spreadsheets().values().update(
-        spreadsheetId=spreadsheet_id,
-        range='A1',
-        valueInputOption='RAW',
-        body=body
-    ).execute()
-    # pylint: enable=no-member
+        row_index += len(batch)
 
 def main():
     """Entry point for feedback exporter."""
@@ -72,8 +121,8 @@ def main():
     if not all([database_url, spreadsheet_id, credentials_json]):
         raise EnvironmentError("Missing one or more required environment variables.")
 
-    df = _fetch_feedback_data(database_url, app_base_url)
-    _write_to_google_sheet(df, spreadsheet_id, credentials_json)
+    batches = _fetch_feedback_data(database_url, app_base_url)
+    _write_to_google_sheet(batches, spreadsheet_id, credentials_json)
 
 if __name__ == "__main__":
     main()
@@ -65,12 +65,12 @@ def get_xml_element_text(root_element: ET.Element, element_name) -> str | None:
     """Get text stored in XML element."""
     element = root_element.find(element_name)
     if element is None:
-        LOG.warning(f"Can not find XML element => {element_name}")
+        LOG.warning("Can not find XML element => %s", element_name)
         return None
 
     element_text = element.text
     if element_text is None:
-        LOG.warning(f"No text found inside of element => {element_name}")
+        LOG.warning("No text found inside of element => %s", element_name)
         return None
 
     return element_text
@@ -99,7 +99,7 @@ def red_hat_docs_path(
         docinfo = file.parent.joinpath(metadata_file_name)
 
         if not docinfo.exists():
-            LOG.warning(f"{docinfo} can not be found. Skipping ...")
+            LOG.warning("%s can not be found. Skipping ...", docinfo)
             continue
 
         with open(docinfo, "r") as f:
@@ -111,12 +111,13 @@ def red_hat_docs_path(
             productnumber = get_xml_element_text(tree, "productnumber")
             if Version(productnumber) != Version(docs_version):
                 LOG.warning(
-                    f"{docinfo} productnumber {productnumber} != {docs_version}. Skipping ..."
+                    "%s productnumber %s != %s. Skipping ...",
+                    docinfo, productnumber, docs_version
                 )
                 continue
 
             if (path_title := get_xml_element_text(tree, "title")) is None:
-                LOG.warning(f"{docinfo} title is blank. Skipping ...")
+                LOG.warning("%s title is blank. Skipping ...", docinfo)
                 continue
 
             path_title = path_title.lower().replace(" ", "_")